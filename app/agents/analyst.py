@@ -1,5 +1,4 @@
 import autogen
-from app.tools.data_analyzer import analyze_data
 
 def analyze_data_function(data_path, analysis_type="descriptive"):
     """
@@ -12,6 +11,9 @@ def analyze_data_function(data_path, analysis_type="descriptive"):
     Returns:
         Analysis results
     """
+    # Imported lazily so pandas/numpy load on the first tool call, not agent creation
+    from app.tools.data_analyzer import analyze_data
+    
     return analyze_data(data_path, analysis_type)
 
 def create_analyst(config_list):
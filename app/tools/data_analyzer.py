@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
 from loguru import logger
+import copy
+import functools
 import json
 import os
 
@@ -16,35 +18,56 @@ def analyze_data(data_path, analysis_type="descriptive"):
         Analysis results
     """
     try:
-        # Load the data
-        data = pd.read_csv(data_path)
-        
-        # Determine the analysis function
-        if analysis_type == "descriptive":
-            results = _descriptive_analysis(data)
-        elif analysis_type == "correlation":
-            results = _correlation_analysis(data)
-        elif analysis_type == "outliers":
-            results = _outlier_detection(data)
+        # Reuse results while a local file is unchanged; copy so callers
+        # cannot alter the cached results
+        if isinstance(data_path, (str, os.PathLike)) and os.path.isfile(data_path):
+            stat = os.stat(data_path)
+            results = copy.deepcopy(_cached_analysis(
+                os.path.realpath(data_path), stat.st_mtime_ns, stat.st_size, analysis_type
+            ))
         else:
-            results = _descriptive_analysis(data)
+            results = _run_analysis(pd.read_csv(data_path), analysis_type)
         
         # Save results to a file
         output_dir = "outputs"
         os.makedirs(output_dir, exist_ok=True)
         
         output_path = os.path.join(output_dir, f"{analysis_type}_analysis.json")
+        payload = json.dumps(results, indent=2, default=str)
         with open(output_path, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
+            f.write(payload)
         
-        logger.info(f"Analysis results saved to {output_path}")
+        logger.info("Analysis results saved to {}", output_path)
         
         return results
         
     except Exception as e:
-        logger.error(f"Error analyzing data: {str(e)}")
+        logger.error("Error analyzing data: {}", e)
         return {"error": str(e)}
 
+def clear_analysis_cache():
+    """Drop all cached analysis results and parsed files"""
+    _cached_analysis.cache_clear()
+    _load_data.cache_clear()
+
+@functools.lru_cache(maxsize=32)
+def _cached_analysis(data_path, mtime_ns, size, analysis_type):
+    """Load a local file and run the analysis, cached per file version"""
+    # Load the data, copying it so an analysis cannot alter the cached frame
+    data = _load_data(data_path, mtime_ns, size).copy()
+    return _run_analysis(data, analysis_type)
+
+@functools.lru_cache(maxsize=1)
+def _load_data(data_path, mtime_ns, size):
+    """Parse the CSV once per file version; shared, so never hand it out uncopied"""
+    return pd.read_csv(data_path)
+
+def _run_analysis(data, analysis_type):
+    """Run the requested analysis on loaded data"""
+    # Determine the analysis function
+    analysis = _ANALYSES.get(analysis_type, _descriptive_analysis)
+    return analysis(data)
+
 def _descriptive_analysis(data):
     """Generate basic statistical summaries"""
     return {
@@ -56,8 +79,23 @@ def _descriptive_analysis(data):
 
 def _correlation_analysis(data):
     """Generate correlation analysis"""
-    numeric_cols = data.select_dtypes(include=[np.number]).columns
-    corr_matrix = data[numeric_cols].corr()
+    numeric = data.select_dtypes(include=[np.number])
+    
+    # Without missing values the whole matrix is a single np.corrcoef call
+    if len(numeric) > 1 and numeric.shape[1] > 0 and not numeric.isna().to_numpy().any():
+        values = numeric.to_numpy(dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr = np.atleast_2d(np.corrcoef(values, rowvar=False))
+        
+        # Match DataFrame.corr(): symmetric, unit diagonal, NaN for constant columns
+        corr = (corr + corr.T) / 2
+        np.fill_diagonal(corr, 1.0)
+        constant = np.ptp(values, axis=0) == 0
+        corr[constant, :] = np.nan
+        corr[:, constant] = np.nan
+        corr_matrix = pd.DataFrame(corr, index=numeric.columns, columns=numeric.columns)
+    else:
+        corr_matrix = numeric.corr()
     
     return {
         "correlation_matrix": corr_matrix.to_dict()
@@ -65,12 +103,23 @@ def _correlation_analysis(data):
 
 def _outlier_detection(data, threshold=3):
     """Detect outliers using z-score method"""
-    numeric_cols = data.select_dtypes(include=[np.number]).columns
+    numeric = data.select_dtypes(include=[np.number])
     results = {}
     
-    for col in numeric_cols:
-        z_scores = np.abs((data[col] - data[col].mean()) / data[col].std())
-        outliers = np.where(z_scores > threshold)[0].tolist()
-        results[col] = {"outlier_indices": outliers, "count": len(outliers)}
+    # Score every column in one pass, then split the hits back per column
+    z_scores = ((numeric - numeric.mean()) / numeric.std()).abs()
+    mask = (z_scores > threshold).to_numpy(dtype=bool, na_value=False)
+    col_idx, row_idx = np.nonzero(mask.T)
+    counts = np.bincount(col_idx, minlength=numeric.shape[1])
     
-    return results
\ No newline at end of file
+    for col, outliers in zip(numeric.columns, np.split(row_idx, np.cumsum(counts)[:-1])):
+        results[col] = {"outlier_indices": outliers.tolist(), "count": len(outliers)}
+    
+    return results
+
+# Analysis functions keyed by analysis type
+_ANALYSES = {
+    "descriptive": _descriptive_analysis,
+    "correlation": _correlation_analysis,
+    "outliers": _outlier_detection,
+}
\ No newline at end of file